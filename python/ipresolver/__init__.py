@@ -0,0 +1,5 @@
+""" Canonical package for the IPResolver CLI. """
+# pylint: disable=E0401
+from ipresolver.main import get_hostname_ip
+
+__all__ = ['get_hostname_ip']
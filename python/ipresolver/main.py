@@ -0,0 +1,684 @@
+""" Import relevant modules in the project. """
+# C0415 is the point here: heavy imports are deliberately deferred to
+# the functions that need them (see the note below the imports).
+# pylint: disable=E0401,C0415
+import asyncio
+import atexit
+import functools
+import hashlib
+import ipaddress
+import json
+import os
+import socket
+import subprocess
+import sys
+import re
+import string
+import tempfile
+import time
+from types import SimpleNamespace
+from urllib.parse import urlsplit
+import click
+
+# Heavy dependencies (SQLAlchemy, Pydantic, aiodns, cachetools, inquirer)
+# are imported inside the functions that need them so a CLI invocation
+# only pays for the modules its subcommand actually uses.
+
+# Define color constants for console output.
+SUCCESS_COLOR = 'green'
+ERROR_COLOR = 'red'
+WARNING_COLOR = 'yellow'
+
+# Anchor the database and cache to the invocation directory once, so the
+# daemon keeps serving the files it was spawned for even though its own
+# working directory never changes.
+_DB_PATH = os.path.abspath('ip_addresses.db')
+_DNS_CACHE_FILE = os.path.abspath('dns_cache.json')
+
+# Define a function to pack a dotted-quad IPv4 string into an integer.
+def _pack_ip(ip_address):
+    """ Function to pack a dotted-quad IPv4 string into a 4-byte integer. """
+    return int.from_bytes(socket.inet_aton(ip_address), 'big')
+
+# Define a function to unpack a stored integer into a dotted-quad string.
+def _unpack_ip(packed):
+    """ Function to unpack a stored integer back into a dotted-quad string. """
+    return socket.inet_ntoa(packed.to_bytes(4, 'big'))
+
+# Define a function to build the database machinery on first use.
+@functools.lru_cache(maxsize=1)
+def _db():  # pylint: disable=R0914
+    """ Function to build the engine, model and statements on first use. """
+    from sqlalchemy import (bindparam, create_engine, delete, event, select,
+                            Column, Integer, String)
+    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+    from sqlalchemy.orm import scoped_session, sessionmaker, declarative_base
+    from sqlalchemy.pool import QueuePool
+
+    # Create a SQLAlchemy database engine backed by an explicit connection pool.
+    base = declarative_base()
+    engine = create_engine(
+        f'sqlite:///{_DB_PATH}',
+        poolclass=QueuePool,
+        pool_size=5,
+        max_overflow=10,
+        pool_pre_ping=True,
+        connect_args={'check_same_thread': False},
+    )
+
+    # Apply the SQLite performance PRAGMAs on every new pooled connection.
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        """ Function to configure WAL mode and cache PRAGMAs per connection. """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
+
+    # Define a model class for the IPAddress table in the database.
+    class IPAddress(base):  # pylint: disable=R0903
+        """Class to handle the table for storing IP addresses."""
+
+        __tablename__ = 'ip_addresses'
+
+        id = Column(Integer, primary_key=True)
+        hostname = Column(String, unique=True, index=True, nullable=False)
+        ip_address_int = Column(Integer, index=True)
+        addresses = Column(String)
+
+    base.metadata.create_all(engine)
+
+    # Migrate databases created before the addresses column and hostname index.
+    with engine.connect() as connection:
+        columns = {row[1] for row in connection.exec_driver_sql(
+            "PRAGMA table_info(ip_addresses)")}
+        if columns and 'addresses' not in columns:
+            connection.exec_driver_sql(
+                "ALTER TABLE ip_addresses ADD COLUMN addresses VARCHAR")
+        if columns and 'ip_address_int' not in columns:
+            connection.exec_driver_sql(
+                "ALTER TABLE ip_addresses ADD COLUMN ip_address_int INTEGER")
+            # Backfill packed values from the legacy dotted-quad column.
+            legacy = connection.exec_driver_sql(
+                "SELECT id, ip_address FROM ip_addresses "
+                "WHERE ip_address IS NOT NULL").fetchall()
+            for row_id, dotted in legacy:
+                try:
+                    packed = _pack_ip(dotted)
+                except OSError:
+                    continue
+                connection.exec_driver_sql(
+                    "UPDATE ip_addresses SET ip_address_int = ? WHERE id = ?",
+                    (packed, row_id))
+        if columns:
+            # Drop duplicate hostnames (keeping the oldest row) so the
+            # unique index can be created on pre-existing history.
+            connection.exec_driver_sql(
+                "DELETE FROM ip_addresses WHERE id NOT IN "
+                "(SELECT MIN(id) FROM ip_addresses GROUP BY hostname)")
+            connection.exec_driver_sql(
+                "CREATE UNIQUE INDEX IF NOT EXISTS ix_ip_addresses_hostname "
+                "ON ip_addresses (hostname)")
+            connection.commit()
+
+    # Build the statements used by the helpers once; each execute then only
+    # binds parameters instead of re-walking the ORM expression tree.
+    upsert = sqlite_insert(IPAddress)
+    upsert = upsert.on_conflict_do_update(
+        index_elements=['hostname'],
+        set_={'ip_address_int': upsert.excluded.ip_address_int,
+              'addresses': upsert.excluded.addresses})
+    select_all = select(IPAddress.id, IPAddress.hostname,
+                        IPAddress.ip_address_int)
+    exists_by_id = select(IPAddress.id).where(
+        IPAddress.id == bindparam('record_id'))
+    delete_by_id = delete(IPAddress).where(
+        IPAddress.id == bindparam('record_id'))
+
+    # Share one thread-local session across operations; it is released
+    # once at process exit instead of being torn down per call.
+    session_factory = scoped_session(sessionmaker(bind=engine))
+    atexit.register(session_factory.remove)
+
+    return SimpleNamespace(
+        engine=engine,
+        Session=session_factory,
+        IPAddress=IPAddress,
+        upsert=upsert,
+        select_all=select_all,
+        exists_by_id=exists_by_id,
+        delete_by_id=delete_by_id,
+    )
+
+# Define a function to reject values that are not valid hostnames.
+def _check_hostname(value):
+    """ Function to reject values that are not valid hostnames. """
+    if not is_valid_hostname(value):
+        raise ValueError(
+            "Invalid input. Please enter a valid hostname or URL.")
+    return value
+
+# Define a function to build the hostname validator on first use.
+@functools.lru_cache(maxsize=1)
+def _get_hostname_validator():
+    """ Function to build the hostname TypeAdapter on first use. """
+    from typing import Annotated
+    from pydantic import TypeAdapter
+    from pydantic.functional_validators import AfterValidator
+
+    # TypeAdapter compiles its core schema a single time instead of per
+    # call like a BaseModel.
+    return TypeAdapter(Annotated[str, AfterValidator(_check_hostname)])
+
+# Define a function to build and warm the DNS cache on first use.
+@functools.lru_cache(maxsize=1)
+def _get_dns_cache():
+    """ Function to build and warm the DNS cache on first use. """
+    from cachetools import TTLCache
+
+    cache = TTLCache(maxsize=1024, ttl=300)
+    try:
+        with open(_DNS_CACHE_FILE, encoding='utf-8') as cache_file:
+            cache.update(json.load(cache_file))
+    except (OSError, ValueError):
+        pass
+
+    atexit.register(_save_dns_cache)
+    return cache
+
+# Define a function to persist the DNS cache for the next CLI run.
+def _save_dns_cache():
+    """ Function to persist the DNS cache to its sidecar file on exit. """
+    try:
+        with open(_DNS_CACHE_FILE, 'w', encoding='utf-8') as cache_file:
+            json.dump(dict(_get_dns_cache()), cache_file)
+    except OSError:
+        pass
+
+# Define a coroutine to resolve a batch of hostnames concurrently.
+async def _resolve_many(hosts):
+    """ Coroutine to resolve several hostnames concurrently via aiodns. """
+    import aiodns
+
+    # Build the resolver inside the running loop: asyncio.run creates a
+    # fresh loop per batch, and a resolver cached across batches stays
+    # bound to the first, closed loop.
+    resolver = aiodns.DNSResolver()
+    lookups = [resolver.gethostbyname(host, socket.AF_INET) for host in hosts]
+    return await asyncio.gather(*lookups, return_exceptions=True)
+
+# Lookup table of the bytes allowed in a hostname (letters, digits, '-', '.').
+_HOSTNAME_BYTES = (string.ascii_letters + string.digits + '-.').encode('ascii')
+
+# Define a function to validate hostnames with a single byte-table scan.
+def is_valid_hostname(hostname):
+    """ Function to validate the entered hostname. """
+    try:
+        encoded = hostname.encode('ascii')
+    except UnicodeEncodeError:
+        return False
+
+    # One C-level pass over the bytes instead of regex backtracking.
+    if encoded.translate(None, _HOSTNAME_BYTES):
+        return False
+
+    labels = encoded.split(b'.')
+    if len(labels) < 2:
+        return False
+
+    # RFC 1035: labels must be non-empty and may not begin or end with '-'.
+    return all(label and not label.startswith(b'-') and not label.endswith(b'-')
+               for label in labels)
+
+# Hostnames that would only trigger pointless (often mDNS) lookups.
+_BLOCKED_HOSTNAMES = frozenset({'localhost'})
+
+# Define a function to reject hostnames that should never reach DNS.
+def _is_blocked(hostname):
+    """ Function to reject hostnames that should never reach DNS. """
+    return (not hostname or hostname in _BLOCKED_HOSTNAMES
+            or hostname.endswith('.local'))
+
+# Define a function to recognise IP literals without a DNS round-trip.
+def _literal_ip(hostname):
+    """ Function to return the normalized IP when the input is a literal. """
+    try:
+        return str(ipaddress.IPv4Address(hostname))
+    except ValueError:
+        return None
+
+# Define a function to resolve a batch of hostnames and store the results.
+def _resolve_batch(hostnames):
+    """ Function to resolve a batch of hostnames and store the successes. """
+    import aiodns
+
+    # Resolve only cache misses, concurrently instead of one blocking call each.
+    # Blocked names and IP literals are decided locally and never queried.
+    dns_cache = _get_dns_cache()
+
+    # Read the cache exactly once per hostname; an entry that expires
+    # during the DNS wait must not turn into a KeyError below.
+    cached = {hostname: dns_cache.get(hostname) for hostname in hostnames}
+    pending = [hostname for hostname in hostnames
+               if cached[hostname] is None and not _is_blocked(hostname)
+               and _literal_ip(hostname) is None]
+    results = dict(zip(pending, asyncio.run(_resolve_many(pending)))) if pending else {}
+
+    resolved = []
+    ip_entries = []
+    for hostname in hostnames:
+        if _is_blocked(hostname):
+            resolved.append((hostname, None))
+            continue
+
+        # IP literals resolve to themselves; skip DNS entirely.
+        ip_literal = _literal_ip(hostname)
+        if ip_literal is not None:
+            ip_entries.append((hostname, ip_literal, json.dumps([ip_literal])))
+            resolved.append((hostname, ip_literal))
+            continue
+
+        addresses = cached[hostname]
+        if addresses is None:
+            result = results[hostname]
+            if isinstance(result, aiodns.error.DNSError):
+                resolved.append((hostname, None))
+                continue
+
+            addresses = result.addresses
+            dns_cache[hostname] = addresses
+
+        # Keep every address from the single lookup so history never
+        # needs a second round-trip for the same host.
+        ip_address = addresses[0]
+        ip_entries.append((hostname, ip_address, json.dumps(addresses)))
+        resolved.append((hostname, ip_address))
+
+    # Store the batch with a single commit instead of one per hostname.
+    if ip_entries:
+        store_ip_addresses(ip_entries)
+
+    return resolved
+
+# Define a function to pull the hostname out of raw user input cheaply.
+def _extract_hostname(entry):
+    """ Function to extract the hostname from an entered URL or bare name. """
+    # Bare hostnames (the common case) skip URL parsing entirely.
+    if '://' in entry:
+        return urlsplit(entry).hostname or entry
+    return entry.strip().rstrip('/').lower()
+
+# Define a function to store resolved IP addresses in the database.
+def store_ip_address(hostname, ip_address):
+    """ Function to store resolved hostnames in the database. """
+
+    store_ip_addresses([(hostname, ip_address, json.dumps([ip_address]))])
+
+# Define a function to store a batch of resolved hostnames in the database.
+def store_ip_addresses(rows):
+    """ Function to store a batch of resolved hostnames with a single commit. """
+    db = _db()
+
+    session = db.Session()
+    session.execute(db.upsert,
+                    [{"hostname": hostname,
+                      "ip_address_int": _pack_ip(ip_address),
+                      "addresses": addresses}
+                     for hostname, ip_address, addresses in rows])
+    session.commit()
+
+# Define a function to retrieve all saved resolved hostnames from the database.
+def get_ip_addresses():
+    """ Function to retrieve all saved resolved hostnames from the database. """
+    db = _db()
+
+    return db.Session().query(db.IPAddress).all()
+
+# Define a function to fetch the history rows used for display.
+def _history_rows():
+    """ Function to fetch the history rows over a Core connection. """
+    db = _db()
+
+    # Read raw rows over a Core connection; printing needs no ORM objects.
+    with db.engine.connect() as connection:
+        return [list(row) for row in connection.execute(db.select_all)]
+
+# Define a function to render the history table in a single pass.
+def _render_history(rows):
+    """ Function to print the history table without the tabulate overhead. """
+    table = [(str(row_id), hostname,
+              _unpack_ip(packed) if packed is not None else '')
+             for row_id, hostname, packed in rows]
+
+    # One width scan per column instead of tabulate's repeated passes.
+    id_width = max(2, max(len(row[0]) for row in table))
+    host_width = max(8, max(len(row[1]) for row in table))
+    ip_width = max(10, max(len(row[2]) for row in table))
+
+    separator = (f"+{'-' * (id_width + 2)}+{'-' * (host_width + 2)}"
+                 f"+{'-' * (ip_width + 2)}+")
+    print(separator)
+    print(f"| {'ID':<{id_width}} | {'Hostname':<{host_width}} "
+          f"| {'IP Address':<{ip_width}} |")
+    print(separator)
+    for row_id, hostname, ip_address in table:
+        print(f"| {row_id:<{id_width}} | {hostname:<{host_width}} "
+              f"| {ip_address:<{ip_width}} |")
+    print(separator)
+
+# Define a function to display resolved hostnames stored in the database.
+def display_ip_history():
+    """ Function to display resolved hostnames stored in the database. """
+    response = _dispatch({'command': 'history'},
+                         lambda: {'rows': _history_rows()})
+    rows = response['rows']
+
+    if rows:
+        print(f"\n\n{'*' * 40}")
+        _render_history(rows)
+        print(f"{'*' * 40}\n")
+
+    else:
+        print("No IP addresses in the database.")
+
+# Define a function to compute the socket path shared with the daemon.
+def _socket_path():
+    """ Function to compute the per-user, per-directory socket path. """
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if not runtime_dir:
+        # Fall back to a private per-user directory rather than dropping
+        # a control socket straight into the world-writable temp dir.
+        runtime_dir = os.path.join(tempfile.gettempdir(),
+                                   f'ipresolver-{os.getuid()}')
+        os.makedirs(runtime_dir, mode=0o700, exist_ok=True)
+        os.chmod(runtime_dir, 0o700)
+
+    # One daemon per working directory, matching the CLI's long-standing
+    # one-database-per-directory behaviour.
+    digest = hashlib.sha256(os.path.dirname(_DB_PATH).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(runtime_dir, f'ipresolver-{digest}.sock')
+
+# Path of the Unix socket shared between the CLI and the daemon.
+_SOCKET_PATH = _socket_path()
+
+# Define a function to run one daemon command against the shared engine.
+def _handle_command(request):
+    """ Function to run one daemon command and build its response. """
+    command = request.get('command')
+
+    try:
+        if command == 'resolve':
+            return {'resolved': _resolve_batch(request['hostnames'])}
+        if command == 'history':
+            return {'rows': _history_rows()}
+        if command == 'delete':
+            return {'deleted': _delete_by_id(request['record_id'])}
+        if command == 'clear':
+            _clear_all()
+            return {'cleared': True}
+    except Exception as error:  # pylint: disable=W0718
+        # One bad request must not take the daemon down with it.
+        return {'error': str(error)}
+
+    return {'error': f'unknown command: {command}'}
+
+# Define a function to read one newline-terminated message from a socket.
+def _read_message(connection):
+    """ Function to read one newline-terminated message from a socket. """
+    data = b''
+    while not data.endswith(b'\n'):
+        chunk = connection.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+# Define a function to serve resolver commands over the local socket.
+def serve_daemon():
+    """ Function to serve resolver commands over a local Unix socket. """
+    try:
+        os.unlink(_SOCKET_PATH)
+    except FileNotFoundError:
+        pass
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(_SOCKET_PATH)
+        server.listen()
+        while True:
+            connection, _ = server.accept()
+            with connection:
+                data = _read_message(connection)
+                if not data.strip():
+                    continue
+                try:
+                    response = _handle_command(json.loads(data))
+                except ValueError:
+                    response = {'error': 'bad request'}
+                try:
+                    connection.sendall(
+                        json.dumps(response).encode('utf-8') + b'\n')
+                except OSError:
+                    # The client went away; keep serving everyone else.
+                    continue
+
+# Define a function to start the background daemon for later invocations.
+def _spawn_daemon():
+    """ Function to start the background daemon and wait for its socket. """
+    try:
+        with open(os.devnull, 'wb') as devnull:
+            subprocess.Popen(  # pylint: disable=R1732
+                [sys.executable, os.path.abspath(__file__), '--daemon'],
+                start_new_session=True, stdout=devnull, stderr=devnull)
+    except OSError:
+        return False
+
+    deadline = time.monotonic() + 1.0
+    while time.monotonic() < deadline:
+        if os.path.exists(_SOCKET_PATH):
+            return True
+        time.sleep(0.05)
+
+    return False
+
+# Define a function to send one JSON command to the daemon.
+def _daemon_request(payload):
+    """ Function to send one JSON command to the daemon, spawning it if needed. """
+    message = json.dumps(payload).encode('utf-8') + b'\n'
+
+    for attempt in range(2):
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.connect(_SOCKET_PATH)
+                client.sendall(message)
+                return json.loads(_read_message(client))
+        except (OSError, ValueError):
+            if attempt == 0 and _spawn_daemon():
+                continue
+            return None
+
+    return None
+
+# Define a function to try the daemon first and fall back to local work.
+def _dispatch(payload, local):
+    """ Function to try the daemon first and fall back to local execution. """
+    response = _daemon_request(payload)
+    if response is None or 'error' in response:
+        return local()
+    return response
+
+# Define a function to resolve IP addresses and store them in the database.
+def resolve_ip():
+    """ Function to resolve the entered URLs/hostnames and store them in the database. """
+    from pydantic import ValidationError
+
+    validator = _get_hostname_validator()
+
+    while True:
+        input_data = click.prompt(
+            click.style(
+                "Please enter one or more website addresses (URLs) or type 'back' to quit",
+                fg="blue"),
+            default='',
+            show_default=False,
+        )
+
+        if input_data == 'back':
+            print(click.style("Operation aborted by the user.", fg=WARNING_COLOR))
+            break
+
+        # Extract the hostname from each entry, parsing only real URLs.
+        candidates = [_extract_hostname(entry)
+                      for entry in re.split(r'[\s,]+', input_data) if entry]
+
+        # Validate before resolving so junk input never reaches DNS.
+        hostnames = []
+        for candidate in candidates:
+            try:
+                hostnames.append(validator.validate_python(candidate))
+            except ValidationError:
+                print(click.style(
+                    f'Invalid input: {candidate} is not a valid hostname or URL.',
+                    fg=ERROR_COLOR))
+
+        if not hostnames:
+            continue
+
+        # Resolve through the daemon when one is running so its warm DNS
+        # cache and page cache are reused; otherwise resolve in-process.
+        response = _dispatch({'command': 'resolve', 'hostnames': hostnames},
+                             lambda: {'resolved': _resolve_batch(hostnames)})
+
+        for hostname, ip_address in response['resolved']:
+            if ip_address is None:
+                print(click.style(
+                    f'Error: Unable to resolve hostname {hostname}.', fg=ERROR_COLOR))
+                continue
+
+            print(f"\n\n{'*' * 40}")
+            print(click.style(f'Hostname: {hostname}', fg=SUCCESS_COLOR))
+            print(f'IP: {ip_address}')
+            print(f"{'*' * 40}\n\n")
+
+# Define a function to delete one record by primary key.
+def _delete_by_id(record_id):
+    """ Function to delete one record by primary key. """
+    db = _db()
+
+    # Delete by primary key in SQL instead of scanning every row in Python.
+    session = db.Session()
+
+    # Short-circuit the common bad-ID path with an index-only lookup.
+    if session.execute(db.exists_by_id,
+                       {'record_id': record_id}).scalar() is None:
+        return False
+
+    session.execute(db.delete_by_id, {'record_id': record_id})
+    session.commit()
+    return True
+
+# Define a function to delete a record from the database using the ID.
+def delete_record():
+    """ Function to delete a record from the database using the ID. """
+    record_id = click.prompt("Enter the ID of the record you want to delete")
+
+    try:
+        record_id = int(record_id)
+    except ValueError:
+        print(click.style(
+            "Invalid ID. Please enter a valid numeric ID.", fg=WARNING_COLOR))
+        return
+
+    response = _dispatch({'command': 'delete', 'record_id': record_id},
+                         lambda: {'deleted': _delete_by_id(record_id)})
+
+    if response['deleted']:
+        print(click.style(
+            f"Record with ID {record_id} deleted successfully.", fg=SUCCESS_COLOR))
+    else:
+        print(click.style(
+            f"No record found with ID {record_id}.", fg=WARNING_COLOR))
+
+# Define a function to delete every stored record.
+def _clear_all():
+    """ Function to delete every stored record. """
+    db = _db()
+
+    session = db.Session()
+    session.query(db.IPAddress).delete()
+    session.commit()
+
+# Define a function to clear all records from the database.
+def clear_database():
+    """ Function to clear all records from the database. """
+    from sqlalchemy.exc import SQLAlchemyError
+
+    try:
+        _dispatch({'command': 'clear'},
+                  lambda: _clear_all() or {'cleared': True})
+        print(click.style("Database cleared successfully.", fg=SUCCESS_COLOR))
+    except SQLAlchemyError as error:
+        print(click.style(
+            f"Error clearing the database: {str(error)}", fg=ERROR_COLOR))
+
+# Define the main CLI function for interacting with IP address resolution and management.
+@click.command()
+@click.option('--resolve', is_flag=True, help="Resolve and store IP address for a URL.")
+@click.option('--history', is_flag=True, help="Display the database history.")
+@click.option('--delete', is_flag=True, help="Delete a record.")
+@click.option('--clear', is_flag=True, help="Clear the database.")
+@click.option('--daemon', is_flag=True, hidden=True,
+              help="Run the background resolver daemon.")
+def get_hostname_ip(resolve, history, delete, clear, daemon):
+    """ Main function to interact with IP address resolution and management. """
+
+    if daemon:
+        serve_daemon()
+    elif resolve:
+        resolve_ip()
+    elif history:
+        display_ip_history()
+    elif delete:
+        delete_record()
+    elif clear:
+        clear_database()
+
+    else:
+        # If no specific option is selected, present a menu for user interaction.
+        import inquirer
+
+        questions = [
+            inquirer.List('menu',
+                          message="Select an option",
+                          choices=[
+                              "Resolve and Store IP Address",
+                              "Display IP History",
+                              "Delete a record",
+                              "Exit"
+                          ]),
+        ]
+
+        while True:
+            answers = inquirer.prompt(questions)
+
+            if answers['menu'] == "Exit":
+                print(click.style("Operation aborted by the user.", fg=WARNING_COLOR))
+                break
+
+            if answers['menu'] == "Display IP History":
+                display_ip_history()
+                break
+
+            if answers['menu'] == "Delete a record":
+                display_ip_history()
+                delete_record()
+                break
+
+            if answers['menu'] == "Resolve and Store IP Address":
+                resolve_ip()
+
+# Entry point of the script, execute the main function if the script is run.
+if __name__ == "__main__":
+    # pylint: disable=E1120
+    get_hostname_ip()